@@ -13,7 +13,7 @@
 # limitations under the License.
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Sequence, Union
+from typing import TYPE_CHECKING, Callable, Sequence, Union
 
 import numpy as np
 import numpy.typing as npt
@@ -24,7 +24,7 @@ from paddle.base.data_feeder import check_type, convert_dtype
 from paddle.base.framework import Variable
 from paddle.distribution import distribution
 from paddle.framework import in_dynamic_mode
-from paddle.tensor import random
+from paddle.pir import Value
 
 if TYPE_CHECKING:
     from typing_extensions import TypeAlias
@@ -40,6 +40,32 @@ if TYPE_CHECKING:
         Tensor,
     ]
 
+# accepted types of `low` and `high`, built once rather than per construction
+_BOUNDARY_TYPES = (
+    int,
+    float,
+    np.ndarray,
+    Variable,
+    Value,
+    list,
+    tuple,
+)
+
+
+def _resolve_dtype(low: _UniformBoundary, high: _UniformBoundary) -> str:
+    """Resolve the dtype of the tensors built from non-tensor boundaries.
+
+    The first float32/float64 numpy array among ``low`` and ``high`` decides
+    the dtype, python scalars and sequences default to float32.
+    """
+    for arg in (low, high):
+        if isinstance(arg, np.ndarray) and arg.dtype.name in (
+            'float32',
+            'float64',
+        ):
+            return arg.dtype.name
+    return 'float32'
+
 
 class Uniform(distribution.Distribution):
     r"""Uniform distribution with `low` and `high` parameters.
@@ -128,34 +154,8 @@ class Uniform(distribution.Distribution):
         name: str | None = None,
     ) -> None:
         if not in_dynamic_mode():
-            check_type(
-                low,
-                'low',
-                (
-                    int,
-                    float,
-                    np.ndarray,
-                    Variable,
-                    paddle.pir.Value,
-                    list,
-                    tuple,
-                ),
-                'Uniform',
-            )
-            check_type(
-                high,
-                'high',
-                (
-                    int,
-                    float,
-                    np.ndarray,
-                    Variable,
-                    paddle.pir.Value,
-                    list,
-                    tuple,
-                ),
-                'Uniform',
-            )
+            check_type(low, 'low', _BOUNDARY_TYPES, 'Uniform')
+            check_type(high, 'high', _BOUNDARY_TYPES, 'Uniform')
 
         self.all_arg_is_float = False
         self.batch_size_unknown = False
@@ -167,36 +167,60 @@ class Uniform(distribution.Distribution):
         if isinstance(high, int):
             high = float(high)
 
-        if self._validate_args(low, high):
+        # tensor bounds are used as they are, `_validate_args` is only needed
+        # to reject a mix of tensors and python/numpy values.
+        if (
+            isinstance(low, paddle.Tensor) and isinstance(high, paddle.Tensor)
+        ) or self._validate_args(low, high):
             self.low = low
             self.high = high
             self.dtype = convert_dtype(low.dtype)
         else:
+            self.dtype = _resolve_dtype(low, high)
             if isinstance(low, float) and isinstance(high, float):
                 self.all_arg_is_float = True
-            if isinstance(low, np.ndarray) and str(low.dtype) in [
-                'float32',
-                'float64',
-            ]:
-                self.dtype = low.dtype
-            elif isinstance(high, np.ndarray) and str(high.dtype) in [
-                'float32',
-                'float64',
-            ]:
-                self.dtype = high.dtype
+                # keep python scalars so `sample` can draw directly in
+                # [low, high) and `log_prob`/`probs` can use them as constants
+                # without reading the bounds back from device. The derived
+                # constants are computed in `self.dtype`, like the tensors.
+                self._scalar_low = low
+                self._scalar_high = high
+                scalar_range = np.array(high, dtype=self.dtype) - np.array(
+                    low, dtype=self.dtype
+                )
+                with np.errstate(divide='ignore', invalid='ignore'):
+                    self._scalar_log_range = float(np.log(scalar_range))
+                    self._scalar_inv_range = float(np.reciprocal(scalar_range))
             self.low, self.high = self._to_tensor(low, high)
             if self.dtype != convert_dtype(self.low.dtype):
                 self.low = paddle.cast(self.low, dtype=self.dtype)
                 self.high = paddle.cast(self.high, dtype=self.dtype)
 
-        super().__init__(self.low.shape)
+        # terms derived from the bounds, filled on first use by `_derived`.
+        self._derived_terms = {}
+
+        if -1 in self.low.shape or -1 in self.high.shape:
+            # the batch size is only known at run time, `sample` reads it from
+            # the broadcast of the bounds.
+            self._sum = self.low + self.high
+            batch_shape = self._sum.shape
+        else:
+            batch_shape = paddle.broadcast_shape(
+                self.low.shape, self.high.shape
+            )
+
+        super().__init__(batch_shape)
 
     def sample(self, shape: list[int], seed: int = 0) -> Tensor:
         """Generate samples of the specified shape.
 
         Args:
             shape (list): 1D `int32`. Shape of the generated samples.
-            seed (int): Python integer number.
+            seed (int, optional): Random seed used for generating samples. If
+                seed is 0, samples are drawn from the global default generator
+                (which can be set by paddle.seed), so consecutive calls are not
+                tied to a fixed seed. If seed is not 0, every call generates
+                the same random numbers. Default is 0.
 
         Returns:
             Tensor, A tensor with prepended dimensions shape. The data type is float32.
@@ -207,42 +231,45 @@ class Uniform(distribution.Distribution):
             check_type(seed, 'seed', (int), 'sample')
 
         name = self.name + '_sample'
-        batch_shape = list((self.low + self.high).shape)
+        if self.all_arg_is_float:
+            return paddle.uniform(
+                shape,
+                dtype=self.dtype,
+                min=self._scalar_low,
+                max=self._scalar_high,
+                seed=seed,
+                name=name,
+            )
+
+        batch_shape = list(self._batch_shape)
         if -1 in batch_shape:
             output_shape = shape + batch_shape
             fill_shape = list(batch_shape + shape)
-            fill_shape[0] = paddle.shape(self.low + self.high)[0].item()
-            zero_tmp = paddle.full(fill_shape, 0.0, self.dtype)
-            uniform_random_tmp = random.uniform_random_batch_size_like(
-                zero_tmp,
-                zero_tmp.shape,
-                dtype=self.dtype,
-                min=0.0,
-                max=1.0,
-                seed=seed,
+            # keep the batch size symbolic, reading it back would block on
+            # the device.
+            fill_shape[0] = paddle.shape(self._sum)[0]
+            uniform_random_tmp = paddle.uniform(
+                fill_shape, dtype=self.dtype, min=0.0, max=1.0, seed=seed
             )
-            zero_tmp_reshape = paddle.reshape(zero_tmp, output_shape)
             uniform_random_tmp_reshape = paddle.reshape(
                 uniform_random_tmp, output_shape
             )
-            output = uniform_random_tmp_reshape * (
-                zero_tmp_reshape + self.high - self.low
-            )
+            output = uniform_random_tmp_reshape * self._range()
             output = paddle.add(output, self.low, name=name)
             return output
         else:
             output_shape = shape + batch_shape
-            output = paddle.uniform(
-                output_shape, dtype=self.dtype, min=0.0, max=1.0, seed=seed
-            ) * (
-                paddle.zeros(output_shape, dtype=self.dtype)
-                + (self.high - self.low)
+            output = (
+                paddle.uniform(
+                    output_shape, dtype=self.dtype, min=0.0, max=1.0, seed=seed
+                )
+                * self._range()
             )
+            if in_dynamic_mode():
+                # `output` already has the full sample shape, shift it in place
+                return _C_ops.add_(output, self.low)
             output = paddle.add(output, self.low, name=name)
-            if self.all_arg_is_float:
-                return paddle.reshape(output, shape, name=name)
-            else:
-                return output
+            return output
 
     def log_prob(self, value: Tensor) -> Tensor:
         """Log probability density/mass function.
@@ -255,23 +282,45 @@ class Uniform(distribution.Distribution):
 
         """
         value = self._check_values_dtype_in_probs(self.low, value)
+        # select the precomputed log density by support instead of taking the
+        # log of a 0/1 indicator.
         if in_dynamic_mode():
-            # ensure value in [low, high]
-            lb_bool = self.low < value
-            ub_bool = value < self.high
-
-            lb = _C_ops.cast(lb_bool, value.dtype)
-            ub = _C_ops.cast(ub_bool, value.dtype)
-            return paddle.log(lb * ub) - paddle.log(self.high - self.low)
+            in_support = _C_ops.logical_and(
+                _C_ops.less_than(self.low, value),
+                _C_ops.less_than(value, self.high),
+            )
+            if self.all_arg_is_float:
+                # always fill from the python scalar, so the result does not
+                # depend on the rank of `value`.
+                inside = _C_ops.full_like(
+                    in_support,
+                    -self._scalar_log_range,
+                    value.dtype,
+                    value.place,
+                )
+                outside = _C_ops.full_like(
+                    in_support,
+                    -self._scalar_log_range - float('inf'),
+                    value.dtype,
+                    value.place,
+                )
+            else:
+                inside, outside = self._log_prob_values()
+                if inside.shape != in_support.shape:
+                    inside = _C_ops.expand(inside, in_support.shape)
+                    outside = _C_ops.expand(outside, in_support.shape)
+            return _C_ops.where(in_support, inside, outside)
         else:
             name = self.name + '_log_prob'
-            lb_bool = self.low < value
-            ub_bool = value < self.high
-            lb = paddle.cast(lb_bool, dtype=value.dtype)
-            ub = paddle.cast(ub_bool, dtype=value.dtype)
-            return paddle.subtract(
-                paddle.log(lb * ub), paddle.log(self.high - self.low), name=name
-            )
+            in_support = paddle.logical_and(self.low < value, value < self.high)
+            inside, outside = self._log_prob_values()
+            if inside.shape != in_support.shape:
+                # match the condition's shape up front, `where` would
+                # otherwise broadcast through a chain of zeros_like/add/cast.
+                support_shape = paddle.shape(in_support)
+                inside = paddle.broadcast_to(inside, support_shape)
+                outside = paddle.broadcast_to(outside, support_shape)
+            return paddle.where(in_support, inside, outside, name=name)
 
     def probs(self, value: Tensor) -> Tensor:
         """Probability density/mass function.
@@ -285,18 +334,23 @@ class Uniform(distribution.Distribution):
         """
         value = self._check_values_dtype_in_probs(self.low, value)
         if in_dynamic_mode():
-            lb_bool = self.low < value
-            ub_bool = value < self.high
-            lb = _C_ops.cast(lb_bool, value.dtype)
-            ub = _C_ops.cast(ub_bool, value.dtype)
-            return (lb * ub) / (self.high - self.low)
+            mask = _C_ops.cast(
+                _C_ops.logical_and(
+                    _C_ops.less_than(self.low, value),
+                    _C_ops.less_than(value, self.high),
+                ),
+                value.dtype,
+            )
+            if self.all_arg_is_float:
+                return _C_ops.scale(mask, self._scalar_inv_range, 0.0, True)
+            return _C_ops.multiply(mask, self._inv_range())
         else:
             name = self.name + '_probs'
-            lb_bool = self.low < value
-            ub_bool = value < self.high
-            lb = paddle.cast(lb_bool, dtype=value.dtype)
-            ub = paddle.cast(ub_bool, dtype=value.dtype)
-            return paddle.divide((lb * ub), (self.high - self.low), name=name)
+            mask = paddle.cast(
+                paddle.logical_and(self.low < value, value < self.high),
+                dtype=value.dtype,
+            )
+            return paddle.multiply(mask, self._inv_range(), name=name)
 
     def entropy(self) -> Tensor:
         r"""Shannon entropy in nats.
@@ -311,5 +365,52 @@ class Uniform(distribution.Distribution):
             Tensor, Shannon entropy of uniform distribution.The data type is float32.
 
         """
+        if in_dynamic_mode():
+            return _C_ops.log(self._range())
         name = self.name + '_entropy'
-        return paddle.log(self.high - self.low, name=name)
+        return paddle.log(self._range(), name=name)
+
+    def _derived(self, key: str, compute: Callable[[], Tensor]) -> Tensor:
+        """Return a term derived from `low` and `high`.
+
+        In dynamic mode the term is computed on first use and kept while both
+        bounds are constants. Otherwise it is computed on every call: trainable
+        bounds may be updated in place by an optimizer, and a kept subgraph
+        would be released by the first backward.
+        """
+        if not (
+            in_dynamic_mode()
+            and self.low.stop_gradient
+            and self.high.stop_gradient
+        ):
+            return compute()
+        term = self._derived_terms.get(key)
+        if term is None:
+            term = compute()
+            self._derived_terms[key] = term
+        return term
+
+    def _range(self) -> Tensor:
+        return self._derived(
+            'range', lambda: paddle.subtract(self.high, self.low)
+        )
+
+    def _log_range(self) -> Tensor:
+        return self._derived('log_range', lambda: paddle.log(self._range()))
+
+    def _inv_range(self) -> Tensor:
+        return self._derived(
+            'inv_range', lambda: paddle.reciprocal(self._range())
+        )
+
+    def _log_prob_values(self) -> tuple[Tensor, Tensor]:
+        """log_prob inside and outside of [low, high).
+
+        The outside value is log(0) - log(high - low), i.e. -inf, or nan when
+        high < low.
+        """
+        inside = self._derived('neg_log_range', lambda: -self._log_range())
+        outside = self._derived(
+            'neg_inf_log_range', lambda: inside - float('inf')
+        )
+        return inside, outside
@@ -382,5 +382,159 @@ class UniformTestSample2(UniformTestSample):
         self.high = 2.0
 
 
+class UniformTestDerivedTerms(unittest.TestCase):
+    def test_trainable_bounds(self):
+        # terms derived from trainable bounds are not kept between calls, so
+        # repeated backward passes work and in-place updates are picked up.
+        paddle.disable_static()
+        low = paddle.to_tensor([0.0, 1.0], stop_gradient=False)
+        high = paddle.to_tensor([2.0, 3.0], stop_gradient=False)
+        uniform = Uniform(low, high)
+        value = paddle.to_tensor([1.5, 2.5])
+        for _ in range(2):
+            uniform.log_prob(value).sum().backward()
+        np.testing.assert_allclose(low.grad.numpy(), [1.0, 1.0], rtol=1e-6)
+        np.testing.assert_allclose(high.grad.numpy(), [-1.0, -1.0], rtol=1e-6)
+
+        high.set_value(np.array([4.0, 5.0], dtype='float32'))
+        np.testing.assert_allclose(
+            uniform.entropy().numpy(), np.log([4.0, 4.0]), rtol=1e-6
+        )
+        np.testing.assert_allclose(
+            uniform.probs(value).numpy(), [0.25, 0.25], rtol=1e-6
+        )
+        paddle.enable_static()
+
+    def test_entropy_is_fresh(self):
+        paddle.disable_static()
+        uniform = Uniform(np.array([0.0, 1.0]), np.array([2.0, 3.0]))
+        entropy = uniform.entropy()
+        entropy.add_(paddle.ones_like(entropy))
+        np.testing.assert_allclose(
+            uniform.entropy().numpy(), np.log([2.0, 2.0]), rtol=1e-6
+        )
+        paddle.enable_static()
+
+
+class UniformTestBroadcastValue(unittest.TestCase):
+    def test_scalar_bounds(self):
+        # a value with more elements than the bounds, partly outside them.
+        paddle.disable_static()
+        uniform = Uniform(1.0, 3.0)
+        values_np = np.array([0.5, 1.5, 2.5, 3.5]).astype('float32')
+        log_prob = uniform.log_prob(paddle.to_tensor(values_np)).numpy()
+        np.testing.assert_allclose(
+            log_prob,
+            [-np.inf, -np.log(2.0), -np.log(2.0), -np.inf],
+            rtol=1e-6,
+        )
+        np.testing.assert_allclose(
+            uniform.probs(paddle.to_tensor(values_np)).numpy(),
+            [0.0, 0.5, 0.5, 0.0],
+            rtol=1e-6,
+        )
+        # a 0-d value, shaped like the bounds, gives the same result
+        single = uniform.log_prob(paddle.to_tensor(values_np[1])).numpy()
+        np.testing.assert_array_equal(single, log_prob[1])
+        paddle.enable_static()
+
+    def test_tensor_bounds(self):
+        paddle.disable_static()
+        low_np = np.array([0.0, 1.0, 2.0]).astype('float32')
+        high_np = np.array([1.0, 3.0, 6.0]).astype('float32')
+        values_np = np.array([[0.5, 0.5, 3.0], [1.5, 2.0, 7.0]]).astype(
+            'float32'
+        )
+        uniform = Uniform(paddle.to_tensor(low_np), paddle.to_tensor(high_np))
+        np_uniform = UniformNumpy(low_np, high_np)
+        value = paddle.to_tensor(values_np)
+        with np.errstate(divide='ignore'):
+            np_log_prob = np_uniform.log_prob(values_np)
+        np.testing.assert_allclose(
+            uniform.log_prob(value).numpy(), np_log_prob, rtol=1e-6
+        )
+        np.testing.assert_allclose(
+            uniform.probs(value).numpy(),
+            np_uniform.probs(values_np),
+            rtol=1e-6,
+        )
+        paddle.enable_static()
+
+
+class UniformTestBatchShape(unittest.TestCase):
+    def test_broadcast_bounds(self):
+        # the batch shape is the broadcast of both bounds, not low's shape.
+        paddle.disable_static()
+        uniform = Uniform(
+            paddle.to_tensor([1.0]), paddle.to_tensor([2.0, 3.0, 4.0])
+        )
+        self.assertEqual(tuple(uniform.batch_shape), (3,))
+        self.assertEqual(list(uniform.sample([2]).shape), [2, 3])
+        paddle.enable_static()
+
+    def test_unknown_batch_size(self, batch_size=5, dims=6):
+        paddle.enable_static()
+        low_np = np.random.randn(batch_size, dims).astype('float32')
+        high_np = np.random.uniform(5.0, 15.0, (batch_size, dims)).astype(
+            'float32'
+        )
+        program = base.Program()
+        with base.program_guard(program):
+            low = paddle.static.data(
+                name='low', shape=[-1, dims], dtype='float32'
+            )
+            high = paddle.static.data(
+                name='high', shape=[-1, dims], dtype='float32'
+            )
+            uniform = Uniform(low, high)
+            self.assertEqual(tuple(uniform.batch_shape), (-1, dims))
+            sample = uniform.sample([7])
+
+        executor = base.Executor(base.CPUPlace())
+        [sample_np] = executor.run(
+            program,
+            feed={'low': low_np, 'high': high_np},
+            fetch_list=[sample],
+        )
+        self.assertEqual(sample_np.shape, (7, batch_size, dims))
+        self.assertTrue((sample_np >= low_np).all())
+        self.assertTrue((sample_np <= high_np).all())
+
+
+class UniformTestToStatic(unittest.TestCase):
+    def setUp(self, batch_size=5, dims=6):
+        self.low_np = np.random.randn(batch_size, dims).astype('float32')
+        self.high_np = np.random.uniform(5.0, 15.0, (batch_size, dims)).astype(
+            'float32'
+        )
+        self.values_np = np.random.randn(batch_size, dims).astype('float32')
+
+    def test_to_static(self):
+        # log_prob, probs and entropy converted by to_static should give the
+        # same results as in dygraph.
+        paddle.disable_static()
+
+        def func(low, high, value):
+            uniform = Uniform(low, high)
+            return (
+                uniform.log_prob(value),
+                uniform.probs(value),
+                uniform.entropy(),
+            )
+
+        low = paddle.to_tensor(self.low_np)
+        high = paddle.to_tensor(self.high_np)
+        value = paddle.to_tensor(self.values_np)
+        dygraph_out = func(low, high, value)
+        static_out = paddle.jit.to_static(func, full_graph=True)(
+            low, high, value
+        )
+        for dygraph_res, static_res in zip(dygraph_out, static_out):
+            np.testing.assert_allclose(
+                dygraph_res.numpy(), static_res.numpy(), rtol=1e-6, atol=1e-6
+            )
+        paddle.enable_static()
+
+
 if __name__ == '__main__':
     unittest.main()